@@ -5,16 +5,22 @@ Run: python build.py
 Output: dist/ (ready to deploy)
 """
 
+import argparse
 import json
+import math
+import os
 import re
 import shutil
 from collections import defaultdict
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
 from pathlib import Path
 
 import yaml
-from jinja2 import Environment, FileSystemLoader, Template
-from markdown import markdown
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from markdown import Markdown
 from PIL import Image
 
 # Paths
@@ -25,25 +31,38 @@ STATIC_DIR = ROOT / "static"
 PHOTOS_DIR = ROOT / "photos"
 IMAGES_DIR = ROOT / "images"
 DIST_DIR = ROOT / "dist"
+JINJA_CACHE_DIR = ROOT / ".jinja_cache"
 
 # Image sizes
 RESIZED_WIDTH = 1600
 HERO_WIDTH = 3000  # Hero images (desktop + mobile) use this for better quality
 THUMB_WIDTH = 400
+# Box-reduce by an integer factor to within this multiple of the target before the LANCZOS pass
+REDUCING_GAP = 3.0
+EXIF_ORIENTATION = 0x0112
+# Dev builds (no --optimize) link JPEGs at or under this size into the 1600 output as-is rather than
+# re-encoding them. The linked file can be somewhat larger than a q88 re-encode (~25% for snowbound.jpg);
+# deploy builds pass --optimize and always re-encode.
+LINK_MAX_BYTES_PER_PIXEL = 0.25
 
 # Banner: fixed height in CSS (px); hide below viewport width = banner_display_width + sidebar
 BANNER_CSS_HEIGHT_PX = 320
 SOCIAL_SIDEBAR_WIDTH_PX = 56  # body padding-left reserved for .social-sidebar
 BANNER_HIDE_BREAKPOINT_DEFAULT = 576
 
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+# Use the libyaml-backed safe loader when PyYAML was built with it (same semantics, much faster)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def parse_frontmatter(text: str) -> tuple[dict, str]:
     """Extract YAML frontmatter from Markdown. Returns (data, body)."""
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", text, re.DOTALL)
+    match = FRONTMATTER_RE.match(text)
     if not match:
         return {}, text
     try:
-        data = yaml.safe_load(match.group(1)) or {}
+        data = yaml.load(match.group(1), Loader=YAML_LOADER) or {}
         return data, match.group(2)
     except yaml.YAMLError:
         return {}, text
@@ -59,45 +78,63 @@ def _external_links_new_tab(html: str) -> str:
     return re.sub(r'<a\s+[^>]*href="https?://[^"]*"[^>]*>', repl, html)
 
 
+# One parser for all pages, reset between documents. Not thread-safe: pages are loaded sequentially.
+_MD = Markdown()
+
+
 def load_markdown_page(path: Path) -> tuple[dict, str]:
     """Load a .md file; return (frontmatter dict, html body)."""
     raw = path.read_text(encoding="utf-8")
     data, body = parse_frontmatter(raw)
-    data["content_html"] = _external_links_new_tab(markdown(body))
+    data["content_html"] = _external_links_new_tab(_MD.reset().convert(body))
     return data, data.get("title", path.stem)
 
 
+def _load_page(path: Path) -> dict:
+    """Load one Markdown page with its slug and title set."""
+    data, title = load_markdown_page(path)
+    data["slug"] = path.stem
+    data["title"] = title
+    return data
+
+
 def load_pages() -> list[dict]:
     """Load all Markdown pages from content/pages/."""
     pages_dir = CONTENT_DIR / "pages"
     if not pages_dir.exists():
         return []
-    pages = []
-    for path in sorted(pages_dir.glob("*.md")):
-        data, title = load_markdown_page(path)
-        data["slug"] = path.stem
-        data["title"] = title
-        pages.append(data)
-    return pages
+    return [_load_page(path) for path in sorted(pages_dir.glob("*.md"))]
+
 
+MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
+
+@lru_cache(maxsize=None)
 def format_date_display(date_str: str) -> str:
     """Format YYYY-MM-DD as '07 Mar 2026'."""
     if not date_str:
         return ""
-    try:
-        dt = datetime.strptime(date_str.strip()[:10], "%Y-%m-%d")
-        return dt.strftime("%d %b %Y")
-    except ValueError:
+    d = _parse_date(date_str)
+    if d is None:
         return date_str
+    return f"{d.day:02d} {MONTH_ABBR[d.month - 1]} {d.year}"
 
 
+@lru_cache(maxsize=None)
 def _parse_date(date_str: str):
     """Parse YYYY-MM-DD to date, or None."""
     if not date_str or not isinstance(date_str, str):
         return None
+    # Splitting is much cheaper than strptime for this one format. Accept what "%Y-%m-%d" did:
+    # a 4-digit year and 1-2 digit month/day (so unpadded 2026-3-7 parses, 26-3-7 doesn't)
+    parts = date_str.strip()[:10].split("-")
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        return None
+    y, m, d = parts
+    if len(y) != 4 or len(m) > 2 or len(d) > 2:
+        return None
     try:
-        return datetime.strptime(date_str.strip()[:10], "%Y-%m-%d").date()
+        return date(int(y), int(m), int(d))
     except ValueError:
         return None
 
@@ -107,7 +144,8 @@ def load_concerts() -> tuple[list[dict], list[dict]]:
     path = CONTENT_DIR / "concerts.yaml"
     if not path.exists():
         return [], []
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
     items = data.get("concerts", data) if isinstance(data, dict) else data
     if not isinstance(items, list):
         return [], []
@@ -135,7 +173,8 @@ def load_albums() -> list[dict]:
     path = CONTENT_DIR / "albums.yaml"
     if not path.exists():
         return []
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
     items = data.get("albums", data) if isinstance(data, dict) else data
     if not isinstance(items, list):
         return []
@@ -156,7 +195,8 @@ def load_videos() -> list[dict]:
     path = CONTENT_DIR / "videos.yaml"
     if not path.exists():
         return []
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
     items = data.get("videos", data) if isinstance(data, dict) else data
     if not isinstance(items, list):
         return []
@@ -168,7 +208,8 @@ def load_band_members(image_assets: list[dict]) -> list[dict]:
     path = CONTENT_DIR / "band-members.yaml"
     if not path.exists():
         return []
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
     members = data.get("members", data) if isinstance(data, dict) else data
     if not isinstance(members, list):
         return []
@@ -195,7 +236,8 @@ def load_reviews() -> list[dict]:
     path = CONTENT_DIR / "reviews.yaml"
     if not path.exists():
         return []
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
     reviews = data.get("reviews", data) if isinstance(data, dict) else data
     if not isinstance(reviews, list):
         return []
@@ -218,7 +260,8 @@ def load_epk_config() -> dict:
     if not path.exists():
         return defaults
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=YAML_LOADER) or {}
         if not isinstance(data, dict):
             return defaults
         for key, value in defaults.items():
@@ -229,10 +272,168 @@ def load_epk_config() -> dict:
         return defaults
 
 
-def process_images(src_dir: Path, dist_dir: Path, url_prefix: str) -> list[dict]:
+def _replace_via_temp(dst, write) -> None:
+    """
+    Call write(tmp) on a temp path next to dst, then os.replace() it over dst.
+    Outputs may be hardlinks to source files, so an existing dst is never opened for writing in place.
+    """
+    tmp = Path(f"{dst}.{os.getpid()}.tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        write(tmp)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _link_or_copy(src, dst) -> None:
+    """Hardlink src to dst, falling back to a copy (e.g. across devices or on filesystems without links)."""
+    def write(tmp: Path) -> None:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copy2(src, tmp)
+    _replace_via_temp(dst, write)
+
+
+def _save_jpeg(img: Image.Image, dest: Path, **options) -> None:
+    """Save img as a JPEG at dest, replacing (not overwriting) any existing file."""
+    _replace_via_temp(dest, lambda tmp: img.save(tmp, "JPEG", **options))
+
+
+def _is_up_to_date(src_mtime: float, outputs: list[Path]) -> bool:
+    """True if every output exists and is at least as new as the source mtime."""
+    try:
+        return all(out.stat().st_mtime >= src_mtime for out in outputs)
+    except FileNotFoundError:
+        return False
+
+
+def _image_outputs(rel: Path, dist_dir: Path) -> dict[str, Path]:
+    """Output paths for one source image, keyed "original", "1600", "thumb" (and "3000" for hero images)."""
+    base = rel.stem
+    subdir = rel.parent
+    outputs = {
+        "original": dist_dir / "original" / rel,
+        "1600": dist_dir / "1600" / subdir / f"{base}-1600.jpg",
+        "thumb": dist_dir / "thumb" / subdir / f"{base}-thumb.jpg",
+    }
+    if base in ("hero", "hero-mobile", "banner"):
+        outputs["3000"] = dist_dir / "3000" / subdir / f"{base}-3000.jpg"
+    return outputs
+
+
+def _asset_info(rel: Path, url_prefix: str) -> dict:
+    """Asset info dict (URLs + name) for one source image, used for gallery rendering."""
+    base = rel.stem
+    subdir = rel.parent
+    return {
+        "original": f"{url_prefix}/original/{rel.as_posix()}",
+        "resized": f"{url_prefix}/1600/{(subdir / f'{base}-1600.jpg').as_posix()}",
+        "thumb": f"{url_prefix}/thumb/{(subdir / f'{base}-thumb.jpg').as_posix()}",
+        "name": str(rel),
+    }
+
+
+def _process_one(path: Path, rel: Path, dist_dir: Path, url_prefix: str, optimize: bool = False) -> dict | None:
+    """
+    Copy one original and write its resized + thumbnail versions.
+    Returns its asset info dict, or None for a zero-width image (left out of the gallery).
+    optimize: encode optimized progressive JPEGs (smaller, slower) instead of fast baseline ones.
+    """
+    name = path.name
+    subdir = rel.parent
+    asset = _asset_info(rel, url_prefix)
+    outputs = _image_outputs(rel, dist_dir)
+    orig_dest = outputs["original"]
+    resized_dest = outputs["1600"]
+    thumb_dest = outputs["thumb"]
+    is_hero = "3000" in outputs
+    hero_dest = outputs.get("3000")
+
+    (dist_dir / "original" / subdir).mkdir(parents=True, exist_ok=True)
+    (dist_dir / "1600" / subdir).mkdir(parents=True, exist_ok=True)
+    (dist_dir / "3000" / subdir).mkdir(parents=True, exist_ok=True)
+    (dist_dir / "thumb" / subdir).mkdir(parents=True, exist_ok=True)
+
+    _link_or_copy(path, orig_dest)
+
+    jpeg_opts = {"optimize": optimize, "progressive": optimize, "subsampling": 2}
+    try:
+        with Image.open(path) as img:
+            src_w, src_h = img.size
+            # Dev builds link a compact JPEG already within the target width as-is instead of re-encoding it
+            # (header-only probe), trading some served size for build time; see LINK_MAX_BYTES_PER_PIXEL.
+            # Skipped for --optimize builds, and when EXIF rotates the image: re-encoding drops EXIF, so
+            # linking would change its orientation.
+            can_link = (
+                not optimize
+                and img.format == "JPEG"
+                and path.stat().st_size <= src_w * src_h * LINK_MAX_BYTES_PER_PIXEL
+                and img.getexif().get(EXIF_ORIENTATION, 1) == 1
+            )
+            # The thumbnail is always re-encoded: with every output a link to the source inode, an in-place
+            # overwrite of the source would leave the mtime check comparing the source with itself
+            link_resized = can_link and src_w <= RESIZED_WIDTH
+            if link_resized:
+                _link_or_copy(path, resized_dest)
+                if is_hero:
+                    _link_or_copy(path, hero_dest)
+
+            if path.suffix.lower() in (".jpg", ".jpeg"):
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale when that still covers the largest output
+                target_w = HERO_WIDTH if is_hero else RESIZED_WIDTH
+                if src_w > target_w:
+                    img.draft("RGB", (target_w, math.ceil(src_h * target_w / src_w)))
+            img = img.convert("RGB") if img.mode in ("RGBA", "P") else img
+            w, h = img.size
+            if w == 0:
+                return None
+
+            if w > RESIZED_WIDTH:
+                resized = img.resize((RESIZED_WIDTH, int(h * RESIZED_WIDTH / w)), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+            else:
+                resized = img
+            if not link_resized:
+                _save_jpeg(resized, resized_dest, quality=88, **jpeg_opts)
+
+            if is_hero and not link_resized:
+                if w > HERO_WIDTH:
+                    hero_img = img.resize((HERO_WIDTH, int(h * HERO_WIDTH / w)), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+                else:
+                    hero_img = img
+                _save_jpeg(hero_img, hero_dest, quality=88, **jpeg_opts)
+
+            # Downscale the thumbnail from the 1600px version: far fewer filter taps than from full-res
+            rw, rh = resized.size
+            if rw > THUMB_WIDTH:
+                thumb = resized.resize((THUMB_WIDTH, int(rh * THUMB_WIDTH / rw)), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+            else:
+                thumb = resized
+            _save_jpeg(thumb, thumb_dest, quality=85, **jpeg_opts)
+    except Exception as e:
+        print(f"  Warning: could not process {name}: {e}")
+
+    return asset
+
+
+def _scan_files(directory: Path | str, extensions: set[str]) -> Iterator[os.DirEntry]:
+    """Recursively yield files under directory whose extension (lowercased) is in extensions."""
+    # os.scandir entries carry file type (and on some platforms stat) info, saving a stat per path
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, extensions)
+            elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions:
+                yield entry
+
+
+def process_images(src_dir: Path, dist_dir: Path, url_prefix: str, optimize: bool = False) -> list[dict]:
     """
     Copy originals and create resized + thumbnail versions from src_dir into dist_dir.
-    Skips any image whose target files already exist (already compressed last run).
+    Skips any image whose target files already exist and are newer than the source (already compressed last run).
+    Remaining images are processed in parallel across CPU cores; output order follows the sorted source paths.
+    optimize: write optimized progressive JPEGs (for deploy builds) instead of fast baseline ones.
     Returns list of asset info dicts (used for gallery rendering).
     """
     if not src_dir.exists():
@@ -243,85 +444,28 @@ def process_images(src_dir: Path, dist_dir: Path, url_prefix: str) -> list[dict]
     (dist_dir / "3000").mkdir(exist_ok=True)
     (dist_dir / "thumb").mkdir(exist_ok=True)
 
-    assets = []
     extensions = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+    entries = sorted(_scan_files(src_dir, extensions), key=lambda e: Path(e.path))
 
-    for path in sorted(src_dir.rglob("*")):
-        if path.suffix.lower() not in extensions or not path.is_file():
-            continue
+    # Freshness is checked here, from the scan's mtimes, so a no-op rebuild never starts the process pool
+    assets = []
+    stale = []
+    for entry in entries:
+        path = Path(entry.path)
         rel = path.relative_to(src_dir)
-        name = path.name
-        base = path.stem
-        subdir = rel.parent
-
-        resized_name = f"{base}-1600.jpg"
-        hero_name = f"{base}-3000.jpg"
-        thumb_name = f"{base}-thumb.jpg"
-        orig_dest = dist_dir / "original" / subdir / name
-        resized_dest = dist_dir / "1600" / subdir / resized_name
-        hero_dest = dist_dir / "3000" / subdir / hero_name
-        thumb_dest = dist_dir / "thumb" / subdir / thumb_name
-
-        orig_url = f"{url_prefix}/original/{rel.as_posix()}"
-        resized_url = f"{url_prefix}/1600/{(subdir / resized_name).as_posix()}"
-        thumb_url = f"{url_prefix}/thumb/{(subdir / thumb_name).as_posix()}"
-
-        is_hero = base in ("hero", "hero-mobile", "banner")
-        skip = orig_dest.exists() and resized_dest.exists() and thumb_dest.exists()
-        if is_hero:
-            skip = skip and hero_dest.exists()
-        if skip:
-            assets.append({
-                "original": orig_url,
-                "resized": resized_url,
-                "thumb": thumb_url,
-                "name": str(rel),
-            })
-            continue
-
-        (dist_dir / "original" / subdir).mkdir(parents=True, exist_ok=True)
-        (dist_dir / "1600" / subdir).mkdir(parents=True, exist_ok=True)
-        (dist_dir / "3000" / subdir).mkdir(parents=True, exist_ok=True)
-        (dist_dir / "thumb" / subdir).mkdir(parents=True, exist_ok=True)
-
-        shutil.copy2(path, orig_dest)
-
-        try:
-            with Image.open(path) as img:
-                img = img.convert("RGB") if img.mode in ("RGBA", "P") else img
-                w, h = img.size
-                if w == 0:
-                    continue
-
-                if w > RESIZED_WIDTH:
-                    resized = img.resize((RESIZED_WIDTH, int(h * RESIZED_WIDTH / w)), Image.Resampling.LANCZOS)
-                else:
-                    resized = img
-                resized.save(resized_dest, "JPEG", quality=88)
-
-                if is_hero:
-                    if w > HERO_WIDTH:
-                        hero_img = img.resize((HERO_WIDTH, int(h * HERO_WIDTH / w)), Image.Resampling.LANCZOS)
-                    else:
-                        hero_img = img
-                    hero_img.save(hero_dest, "JPEG", quality=88)
-
-                if w > THUMB_WIDTH:
-                    thumb = img.resize((THUMB_WIDTH, int(h * THUMB_WIDTH / w)), Image.Resampling.LANCZOS)
-                else:
-                    thumb = img
-                thumb.save(thumb_dest, "JPEG", quality=85)
-        except Exception as e:
-            print(f"  Warning: could not process {name}: {e}")
-
-        assets.append({
-            "original": orig_url,
-            "resized": resized_url,
-            "thumb": thumb_url,
-            "name": str(rel),
-        })
+        if _is_up_to_date(entry.stat().st_mtime, list(_image_outputs(rel, dist_dir).values())):
+            assets.append(_asset_info(rel, url_prefix))
+        else:
+            stale.append((len(assets), path, rel))
+            assets.append(None)
 
-    return assets
+    if stale:
+        worker = partial(_process_one, dist_dir=dist_dir, url_prefix=url_prefix, optimize=optimize)
+        with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as ex:
+            results = ex.map(worker, [path for _, path, _ in stale], [rel for _, _, rel in stale])
+            for (i, _, _), asset in zip(stale, results):
+                assets[i] = asset
+    return [a for a in assets if a is not None]
 
 
 def group_photos_by_album(photos: list[dict]) -> tuple[list[dict], list[dict]]:
@@ -367,8 +511,20 @@ def get_banner_hide_breakpoint(images_dist: Path) -> int:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the band site into dist/.")
+    parser.add_argument("--clean", action="store_true", help="remove dist/ entirely, re-processing all images")
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="encode optimized progressive JPEGs for deploy (slower; only affects images processed in this run)",
+    )
+    args = parser.parse_args()
+
     print("Building band site...")
-    # Recreate dist but keep photos/ and images/ (skip re-compressing existing outputs)
+    if args.clean and DIST_DIR.exists():
+        print("  Removing dist/...")
+        shutil.rmtree(DIST_DIR)
+    # Recreate dist but keep photos/ and images/ (skip re-compressing up-to-date outputs)
     DIST_DIR.mkdir(parents=True, exist_ok=True)
     if DIST_DIR.exists():
         for item in DIST_DIR.iterdir():
@@ -378,7 +534,13 @@ def main() -> None:
                 else:
                     shutil.rmtree(item)
 
-    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
+    # Compiled templates are cached on disk between builds; templates don't change mid-build
+    JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+        auto_reload=False,
+    )
     env.filters["tojson"] = lambda v: json.dumps(v)
 
     # Load data
@@ -390,24 +552,26 @@ def main() -> None:
 
     # Process photos (gallery)
     print("  Processing photos...")
-    photos = process_images(PHOTOS_DIR, DIST_DIR / "photos", "photos")
+    photos = process_images(PHOTOS_DIR, DIST_DIR / "photos", "photos", optimize=args.optimize)
     photo_albums, all_photos_ordered = group_photos_by_album(photos)
 
     # Process images (banner, artwork, etc.)
     print("  Processing images...")
-    image_assets = process_images(IMAGES_DIR, DIST_DIR / "images", "images")
+    image_assets = process_images(IMAGES_DIR, DIST_DIR / "images", "images", optimize=args.optimize)
     band_members = load_band_members(image_assets)
     reviews = load_reviews()
 
     # Copy static and inject build-time values (e.g. banner breakpoint) into CSS
     if STATIC_DIR.exists():
         print("  Copying static/...")
-        shutil.copytree(STATIC_DIR, DIST_DIR / "static")
+        shutil.copytree(STATIC_DIR, DIST_DIR / "static", copy_function=_link_or_copy)
     banner_breakpoint = get_banner_hide_breakpoint(DIST_DIR / "images")
     style_css = DIST_DIR / "static" / "style.css"
     if style_css.exists():
         style_content = style_css.read_text(encoding="utf-8")
         if "BANNER_BREAKPOINT" in style_content:
+            # Unlink first: the copy may be a hardlink to static/style.css
+            style_css.unlink()
             style_css.write_text(
                 Template(style_content).render(BANNER_BREAKPOINT=banner_breakpoint),
                 encoding="utf-8",
@@ -439,23 +603,23 @@ def main() -> None:
     )
 
     # Render each Markdown page (e.g. about -> about/index.html)
-    for page in pages:
-        slug = page["slug"]
-        print(f"  Writing {slug}/index.html...")
-        out_dir = DIST_DIR / slug
+    template_about = env.get_template("about.html")
+    template_page = env.get_template("page.html")
+    def write_page(page: dict) -> None:
+        out_dir = DIST_DIR / page["slug"]
         out_dir.mkdir(parents=True, exist_ok=True)
-        if slug == "about":
-            template_about = env.get_template("about.html")
-            (out_dir / "index.html").write_text(
-                template_about.render(page=page, band_members=band_members, reviews=reviews, **subdir_common),
-                encoding="utf-8",
-            )
+        if page["slug"] == "about":
+            html = template_about.render(page=page, band_members=band_members, reviews=reviews, **subdir_common)
         else:
-            template_page = env.get_template("page.html")
-            (out_dir / "index.html").write_text(
-                template_page.render(page=page, **subdir_common),
-                encoding="utf-8",
-            )
+            html = template_page.render(page=page, **subdir_common)
+        (out_dir / "index.html").write_text(html, encoding="utf-8")
+    with ThreadPoolExecutor() as ex:
+        futures = []
+        for page in pages:
+            print(f"  Writing {page['slug']}/index.html...")
+            futures.append(ex.submit(write_page, page))
+        for future in futures:
+            future.result()
 
     # Shows page (past and upcoming, latest first)
     print("  Writing shows/index.html...")